@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Dict, Any
 from ...core.database import get_db
@@ -47,9 +47,9 @@ async def generate_content(
 
 @router.post("/script", response_model=Dict[str, Any])
 async def generate_script(
-    topic: str,
+    topic: str = Query(..., min_length=1),
     style: str = "engaging",
-    duration: int = 60,
+    duration: int = Query(60, gt=0),
     platform: str = "youtube",
     additional_context: str = None
 ):
@@ -1,7 +1,13 @@
-from .ai_content_generator import AIContentGenerator
-from .voice_generator import VoiceGenerator
-from .video_processor import VideoProcessor
-from .social_publisher import SocialMediaPublisher
+import importlib
+
+# Services are imported on first access so that importing the package does
+# not pull in every service's third-party clients.
+_SERVICE_MODULES = {
+    "AIContentGenerator": "ai_content_generator",
+    "VoiceGenerator": "voice_generator",
+    "VideoProcessor": "video_processor",
+    "SocialMediaPublisher": "social_publisher",
+}
 
 __all__ = [
     "AIContentGenerator",
@@ -9,3 +15,16 @@ __all__ = [
     "VideoProcessor",
     "SocialMediaPublisher"
 ]
+
+
+def __getattr__(name):
+    if name in _SERVICE_MODULES:
+        module = importlib.import_module(f".{_SERVICE_MODULES[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
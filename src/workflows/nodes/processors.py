@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator
 import asyncio
 import json
 import tempfile
@@ -6,6 +6,13 @@ import tempfile
 class BaseNode:
     """Base class for all workflow nodes"""
     
+    # Every node subclass, keyed by class name (the "type" used in workflow definitions)
+    NODE_REGISTRY: Dict[str, type] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        BaseNode.NODE_REGISTRY[cls.__name__] = cls
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         
@@ -112,16 +119,30 @@ class BatchProcessorNode(BaseNode):
     
     async def execute(self, inputs: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         items = inputs.get("items", [])
+        
+        results = await asyncio.gather(*(self.process_item(item, context) for item in items))
+        
+        return {"results": list(results)}
+    
+    async def execute_stream(self, inputs: Dict[str, Any], context: Dict[str, Any]) -> AsyncIterator[Any]:
+        """Yield each item's result as soon as it completes (completion order)"""
+        items = inputs.get("items", [])
+        tasks = [asyncio.create_task(self.process_item(item, context)) for item in items]
+        
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # A consumer that stops early must not leave items running in the background
+            for task in tasks:
+                task.cancel()
+    
+    async def process_item(self, item: Any, context: Dict[str, Any]) -> Any:
+        """Process a single batch item"""
         node_type = self.config.get("node_type")
-        node_config = self.config.get("node_config", {})
         
-        results = []
-        for item in items:
-            # Mock batch processing
-            result = f"Processed {item} with {node_type}"
-            results.append(result)
-                
-        return {"results": results}
+        # Mock batch processing
+        return f"Processed {item} with {node_type}"
 
 class SocialMediaPostNode(BaseNode):
     """Post content to a single social media platform"""
@@ -365,4 +365,20 @@ WORKFLOW_TEMPLATES = {
     "scheduled_content": SCHEDULED_CONTENT_WORKFLOW,
     "analytics": ANALYTICS_WORKFLOW,
     "content_moderation": CONTENT_MODERATION_WORKFLOW
-}
\ No newline at end of file
+}
+
+
+def _validate():
+    """Check every template node type against the node registry"""
+    from ..nodes import BaseNode
+    
+    missing = {
+        node["type"]
+        for template in WORKFLOW_TEMPLATES.values()
+        for node in template["nodes"]
+    } - BaseNode.NODE_REGISTRY.keys()
+    assert not missing, f"Undefined node types: {missing}"
+
+
+if __debug__:
+    _validate()
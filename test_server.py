@@ -4,15 +4,82 @@ Simple HTTP server to test the frontend UI
 """
 
 import http.server
-import socketserver
 import os
+import socket
 import sys
+import time
 from urllib.parse import urlparse
 import json
 
+# Content types by file extension
+_CTYPE = {
+    ".html": "text/html",
+    ".css": "text/css",
+    ".js": "application/javascript",
+}
+
+# Seconds between mtime checks of a cached static file
+_STAT_INTERVAL = 1.0
+
+# file path -> (content, content type, mtime, monotonic time of last mtime check)
+_CACHE = {}
+
+# Mock API responses, JSON-encoded once at import
+mock_responses = {
+    "/api/v1/auth/me": {"username": "demo_user", "email": "demo@example.com"},
+    "/api/v1/analytics/overview": {
+        "total_publications": 25,
+        "total_views": 125000,
+        "total_engagement": 8500,
+        "engagement_rate": 6.8
+    },
+    "/api/v1/content/queue": {"queue": [], "count": 4},
+    "/api/v1/services/status": {"services": []},
+    "/health": {"status": "healthy", "version": "1.0.0"},
+    "/health/detailed": {
+        "status": "healthy",
+        "database": "connected",
+        "redis": "connected",
+        "services": "operational"
+    }
+}
+
+_MOCK_BYTES = {path: json.dumps(data).encode() for path, data in mock_responses.items()}
+
+def _load_static_file(file_path):
+    """Return (content, content_type) for a file, re-reading it only when its mtime changes"""
+    now = time.monotonic()
+    cached = _CACHE.get(file_path)
+    if cached and now - cached[3] <= _STAT_INTERVAL:
+        return cached[0], cached[1]
+    
+    try:
+        mtime = os.stat(file_path).st_mtime
+    except FileNotFoundError:
+        _CACHE.pop(file_path, None)
+        return None
+    
+    if cached and cached[2] == mtime:
+        content, content_type = cached[0], cached[1]
+    else:
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        content_type = _CTYPE.get(os.path.splitext(file_path)[1], 'application/octet-stream')
+    
+    _CACHE[file_path] = (content, content_type, mtime, now)
+    return content, content_type
+
 class FrontendHandler(http.server.SimpleHTTPRequestHandler):
     """Custom handler to serve the frontend files and mock API responses"""
     
+    # Pages served from a fixed file, looked up by exact path
+    _EXACT = {
+        "/": "static/index.html",
+        "/dashboard": "static/index.html",
+        "/dashboard/content": "static/templates/content-debug.html",
+        "/api-keys": "static/templates/api-keys.html",
+    }
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=".", **kwargs)
     
@@ -22,14 +89,9 @@ class FrontendHandler(http.server.SimpleHTTPRequestHandler):
         path = parsed_path.path
         
         # Route handling
-        if path == "/":
-            self.serve_file("static/index.html")
-        elif path == "/dashboard":
-            self.serve_file("static/index.html")
-        elif path == "/dashboard/content":
-            self.serve_file("static/templates/content-debug.html")
-        elif path == "/api-keys":
-            self.serve_file("static/templates/api-keys.html")
+        target = self._EXACT.get(path)
+        if target:
+            self.serve_file(target)
         elif path.startswith("/static/"):
             # Serve static files
             file_path = path[1:]  # Remove leading slash
@@ -43,19 +105,9 @@ class FrontendHandler(http.server.SimpleHTTPRequestHandler):
     def serve_file(self, file_path):
         """Serve a specific file"""
         try:
-            if os.path.exists(file_path):
-                with open(file_path, 'rb') as f:
-                    content = f.read()
-                
-                # Set content type based on file extension
-                if file_path.endswith('.html'):
-                    content_type = 'text/html'
-                elif file_path.endswith('.css'):
-                    content_type = 'text/css'
-                elif file_path.endswith('.js'):
-                    content_type = 'application/javascript'
-                else:
-                    content_type = 'application/octet-stream'
+            static_file = _load_static_file(file_path)
+            if static_file:
+                content, content_type = static_file
                 
                 self.send_response(200)
                 self.send_header('Content-type', content_type)
@@ -69,37 +121,31 @@ class FrontendHandler(http.server.SimpleHTTPRequestHandler):
     
     def handle_api_request(self, path):
         """Handle mock API requests"""
-        mock_responses = {
-            "/api/v1/auth/me": {"username": "demo_user", "email": "demo@example.com"},
-            "/api/v1/analytics/overview": {
-                "total_publications": 25,
-                "total_views": 125000,
-                "total_engagement": 8500,
-                "engagement_rate": 6.8
-            },
-            "/api/v1/content/queue": {"queue": [], "count": 4},
-            "/api/v1/services/status": {"services": []},
-            "/health": {"status": "healthy", "version": "1.0.0"},
-            "/health/detailed": {
-                "status": "healthy",
-                "database": "connected",
-                "redis": "connected",
-                "services": "operational"
-            }
-        }
-        
-        response_data = mock_responses.get(path, {"message": "Mock API response", "path": path})
+        body = _MOCK_BYTES.get(path) or json.dumps({"message": "Mock API response", "path": path}).encode()
         
         self.send_response(200)
         self.send_header('Content-type', 'application/json')
+        self.send_header('Content-length', len(body))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(json.dumps(response_data).encode())
+        self.wfile.write(body)
     
     def log_message(self, format, *args):
         """Custom log message format"""
         print(f"[{self.date_time_string()}] {format % args}")
 
+class FrontendServer(http.server.ThreadingHTTPServer):
+    """Threaded server so concurrent asset requests don't serialize"""
+    
+    allow_reuse_address = True
+    daemon_threads = True
+    
+    def server_bind(self):
+        # SO_REUSEPORT (Linux/BSD) must be set before bind
+        if hasattr(socket, "SO_REUSEPORT"):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
 def main():
     port = 8000
     
@@ -108,7 +154,7 @@ def main():
     os.chdir(project_dir)
     
     try:
-        with socketserver.TCPServer(("", port), FrontendHandler) as httpd:
+        with FrontendServer(("", port), FrontendHandler) as httpd:
             print(f"🚀 Frontend server running at http://localhost:{port}")
             print(f"📊 Dashboard: http://localhost:{port}/dashboard")
             print(f"🔧 Content Debug: http://localhost:{port}/dashboard/content")
@@ -10,15 +10,12 @@ import os
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from workflows.engine import WorkflowEngine
-from workflows.nodes.processors import ContentGeneratorNode, VideoProcessorNode, SocialMediaPostNode
-from workflows.nodes.triggers import ManualTrigger
-from workflows.templates import WORKFLOW_TEMPLATES
-from automation.queue_manager import QueueManager
-from automation.scheduler import ContentScheduler
-
 async def test_workflow_engine():
     """Test the workflow engine"""
+    from workflows.engine import WorkflowEngine
+    from workflows.nodes.processors import ContentGeneratorNode, VideoProcessorNode, SocialMediaPostNode
+    from workflows.nodes.triggers import ManualTrigger
+    
     print("🚀 Testing Workflow Engine")
     print("=" * 50)
     
@@ -73,13 +70,16 @@ async def test_workflow_engine():
 
 def test_workflow_templates():
     """Test workflow templates"""
+    from workflows.templates import WORKFLOW_TEMPLATES
+    
     print("\n📋 Testing Workflow Templates")
     print("=" * 50)
     
     print(f"✅ Found {len(WORKFLOW_TEMPLATES)} workflow templates:")
-    
-    for template_id, template in WORKFLOW_TEMPLATES.items():
-        print(f"  - {template_id}: {template['name']} ({len(template['nodes'])} nodes)")
+    print("\n".join(
+        f"  - {template_id}: {template['name']} ({len(template['nodes'])} nodes)"
+        for template_id, template in WORKFLOW_TEMPLATES.items()
+    ))
     
     # Test a specific template
     reel_template = WORKFLOW_TEMPLATES.get("instagram_reel")
@@ -88,11 +88,12 @@ def test_workflow_templates():
         print(f"  Name: {reel_template['name']}")
         print(f"  Description: {reel_template['description']}")
         print(f"  Nodes: {len(reel_template['nodes'])}")
-        for node in reel_template['nodes']:
-            print(f"    - {node['id']} ({node['type']})")
+        print("\n".join(f"    - {node['id']} ({node['type']})" for node in reel_template['nodes']))
 
 def test_queue_manager():
     """Test queue manager"""
+    from automation.queue_manager import QueueManager
+    
     print("\n📬 Testing Queue Manager")
     print("=" * 50)
     
@@ -122,6 +123,8 @@ def test_queue_manager():
 
 async def test_scheduler():
     """Test content scheduler"""
+    from automation.scheduler import ContentScheduler
+    
     print("\n📅 Testing Content Scheduler")
     print("=" * 50)
     
@@ -1,35 +1,72 @@
 import pytest
-import asyncio
+import pytest_asyncio
+from pytest_asyncio import is_async_test
 import os
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from typing import AsyncGenerator, Generator
-import tempfile
-import shutil
+from sqlalchemy.pool import StaticPool
+from types import MappingProxyType, SimpleNamespace
+from typing import AsyncGenerator
+from unittest.mock import AsyncMock, patch
 
-from src.main import app
-from src.core.config import settings
-from src.core.database import get_db
-from src.models import Base
+from tests.helpers import rate_limiters
 
 
-# Test database URL (use SQLite for testing)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# Test database URL (use in-memory SQLite for testing), one database per pytest-xdist worker
+TEST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+TEST_DATABASE_URL = f"sqlite+aiosqlite:///file:testdb_{TEST_WORKER}?mode=memory&cache=shared&uri=true"
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session event loop shared with the fixtures"""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def fast_password_hashing():
+    """Use the minimum bcrypt work factor for the test session"""
+    from passlib.context import CryptContext
+    from src.api.routers import auth
+    
+    original_context = auth.pwd_context
+    auth.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4)
+    
+    yield auth.pwd_context
+    
+    auth.pwd_context = original_context
 
 
 @pytest.fixture(scope="session")
+def app(fast_password_hashing):
+    """Import the FastAPI app only for tests that need it"""
+    from src.main import app as _app
+    return _app
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def test_engine():
     """Create test database engine"""
-    engine = create_async_engine(TEST_DATABASE_URL, echo=True)
+    from src.models import Base
+    
+    # StaticPool keeps the single connection (and so the in-memory database) alive
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False}
+    )
+    
+    # Let SQLAlchemy emit BEGIN itself so per-test SAVEPOINT/rollback works on SQLite
+    @event.listens_for(engine.sync_engine, "connect")
+    def disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
     
     # Create all tables
     async with engine.begin() as conn:
@@ -44,27 +81,48 @@ async def test_engine():
     await engine.dispose()
 
 
+# Database session handed to the app for the currently running test
+_current_db = {}
+
+
 @pytest.fixture
 async def test_db(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session"""
-    async_session = sessionmaker(
-        test_engine, class_=AsyncSession, expire_on_commit=False
-    )
-    
-    async with async_session() as session:
-        yield session
+    """Create test database session, rolled back after each test"""
+    async with test_engine.connect() as connection:
+        transaction = await connection.begin()
+        
+        # Commits inside the test become savepoints of the outer transaction
+        session = AsyncSession(
+            bind=connection,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
+        
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
 
 
-@pytest.fixture
-async def client(test_db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Create test client with dependency overrides"""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_client(app, test_engine) -> AsyncGenerator[AsyncClient, None]:
+    """Create one test client with dependency overrides for the whole session"""
+    from src.core.database import get_db
     
-    def override_get_db():
-        return test_db
+    async def override_get_db():
+        session = _current_db.get("session")
+        if session is not None:
+            yield session
+            return
+        
+        # Requests made outside a test (e.g. the session-wide login) get their own session
+        async with AsyncSession(test_engine, expire_on_commit=False) as session:
+            yield session
     
     app.dependency_overrides[get_db] = override_get_db
     
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
     
     # Clean up dependency overrides
@@ -72,22 +130,145 @@ async def client(test_db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
 
 
 @pytest.fixture
-def temp_content_dir():
-    """Create temporary directory for content generation tests"""
-    temp_dir = tempfile.mkdtemp()
+async def client(app, session_client: AsyncClient, test_db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+    """Point the shared test client at this test's database session"""
+    # The app is shared for the session, so start each test with an empty per-IP request budget
+    for limiter in rate_limiters(app):
+        limiter.clients.clear()
+    _current_db["session"] = test_db
+    original_headers = session_client.headers.copy()
+    
+    yield session_client
+    
+    # Don't leak per-test headers (e.g. Authorization) into later tests
+    session_client.headers = original_headers
+    _current_db.pop("session", None)
+
+
+@pytest.fixture
+async def async_client(client: AsyncClient) -> AsyncClient:
+    """Alias of the shared in-process client for tests that ask for async_client"""
+    return client
+
+
+@pytest.fixture
+def performance_runner(async_client: AsyncClient):
+    """Performance test runner driving the shared client on the session loop"""
+    from src.utils.test_utils import PerformanceTestRunner
+    return PerformanceTestRunner(async_client)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def admin_token(session_client: AsyncClient) -> str:
+    """Log in once per session and share the access token"""
+    response = await session_client.post(
+        "/api/v1/auth/login",
+        params={"username": "admin", "password": "admin"}
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["access_token"]
+
+
+@pytest.fixture
+async def authenticated_client(client: AsyncClient, admin_token: str) -> AsyncClient:
+    """Get the test client with a valid bearer token"""
+    client.headers.update({"Authorization": f"Bearer {admin_token}"})
+    return client
+
+
+@pytest.fixture(scope="module")
+def temp_content_dir(tmp_path_factory):
+    """Create temporary directory for content generation tests, shared by a module's tests"""
+    from src.core.config import settings
+    
+    temp_dir = str(tmp_path_factory.mktemp("content"))
     original_content_dir = settings.CONTENT_OUTPUT_DIR
     settings.CONTENT_OUTPUT_DIR = temp_dir
     
     yield temp_dir
     
-    # Cleanup
-    shutil.rmtree(temp_dir)
     settings.CONTENT_OUTPUT_DIR = original_content_dir
 
 
+@pytest.fixture(scope="module")
+def service_patchers():
+    """Patchers for the AI, voice, video and publishing service methods, one per mocked method"""
+    from src.services.ai_content_generator import AIContentGenerator
+    from src.services.social_publisher import SocialMediaPublisher
+    from src.services.video_processor import VideoProcessor
+    from src.services.voice_generator import VoiceGenerator
+    
+    targets = {
+        "script": (AIContentGenerator, "generate_script"),
+        "titles": (AIContentGenerator, "generate_title_suggestions"),
+        "description": (AIContentGenerator, "generate_description"),
+        "hashtags": (AIContentGenerator, "generate_hashtags"),
+        "speech": (VoiceGenerator, "generate_speech"),
+        "voices": (VoiceGenerator, "get_available_voices"),
+        "video": (VideoProcessor, "create_video_from_script"),
+        "publish_youtube": (SocialMediaPublisher, "publish_to_youtube"),
+        "publish_instagram": (SocialMediaPublisher, "publish_to_instagram"),
+        "publish_facebook": (SocialMediaPublisher, "publish_to_facebook"),
+        "publish_tiktok": (SocialMediaPublisher, "publish_to_tiktok"),
+        "platform_analytics": (SocialMediaPublisher, "get_platform_analytics"),
+    }
+    return {
+        name: patch.object(cls, attribute, new_callable=AsyncMock)
+        for name, (cls, attribute) in targets.items()
+    }
+
+
+@pytest.fixture(scope="module")
+def patched_services(service_patchers):
+    """Patch the service methods once per module; modules using it list it in pytestmark"""
+    mocks = SimpleNamespace(**{name: patcher.start() for name, patcher in service_patchers.items()})
+    
+    yield mocks
+    
+    for patcher in service_patchers.values():
+        patcher.stop()
+
+
+@pytest.fixture
+def mock_services(patched_services):
+    """Hand the test freshly reset service mocks; tests only set return values"""
+    for mock in vars(patched_services).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    return patched_services
+
+
+@pytest.fixture
+def real_services(service_patchers, patched_services):
+    """Run one test against the real service methods, then restore the module's mocks"""
+    for patcher in service_patchers.values():
+        patcher.stop()
+    
+    yield
+    
+    for name, patcher in service_patchers.items():
+        setattr(patched_services, name, patcher.start())
+
+
+@pytest.fixture(scope="session")
+def prebuilt_media(tmp_path_factory):
+    """Placeholder media files for mocked services to hand back, written once per session"""
+    media_dir = tmp_path_factory.mktemp("media")
+    (media_dir / "audio.mp3").write_bytes(b"mock audio content")
+    (media_dir / "video.mp4").write_bytes(b"mock video content")
+    return media_dir
+
+
+@pytest.fixture(scope="session")
+def mock_video_path(prebuilt_media) -> str:
+    """Path of the placeholder video handed to the patched publishers"""
+    return str(prebuilt_media / "video.mp4")
+
+
 @pytest.fixture
 def mock_api_keys():
-    """Mock API keys for testing"""
+    """Mock API keys for testing, restored after each test so tests without them see no keys"""
+    from src.core.config import settings
+    
     test_keys = {
         "OPENAI_API_KEY": "test_openai_key",
         "ELEVENLABS_API_KEY": "test_elevenlabs_key", 
@@ -116,10 +297,10 @@ def mock_user_token():
     return "test_bearer_token"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_content_request():
-    """Sample content generation request"""
-    return {
+    """Sample content generation request, read-only; copy with dict(...) to vary it"""
+    return MappingProxyType({
         "title": "Test AI Content",
         "topic": "Testing AI content generation",
         "content_type": "video",
@@ -127,7 +308,21 @@ def sample_content_request():
         "style": "educational",
         "target_platforms": ["youtube", "instagram"],
         "project_id": 1
-    }
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_content_data():
+    """Sample content generation request data, read-only; copy with dict(...) to vary it"""
+    return MappingProxyType({
+        "title": "Test Content Title",
+        "topic": "This is a test content topic for automated testing",
+        "content_type": "video",
+        "duration": 60,
+        "style": "educational",
+        "target_platforms": ["youtube", "instagram"],
+        "project_id": 1
+    })
 
 
 @pytest.fixture
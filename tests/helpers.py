@@ -0,0 +1,48 @@
+"""
+Assertion and JSON helpers shared by the test modules.
+
+Nothing here imports from src at module level, so importing the helpers never loads the app.
+"""
+try:
+    import orjson
+    loads = orjson.loads
+    dumps = orjson.dumps
+except ImportError:
+    import json
+    loads = json.loads
+
+    def dumps(obj):
+        return json.dumps(obj).encode()
+
+
+def rate_limiters(app):
+    """Yield the RateLimitMiddleware instances in the app's built middleware stack"""
+    from src.middleware.security import RateLimitMiddleware
+    
+    layer = app.middleware_stack
+    while layer is not None:
+        if isinstance(layer, RateLimitMiddleware):
+            yield layer
+        layer = getattr(layer, "app", None)
+
+
+def read_json(response):
+    """Decode a response body, with orjson when available"""
+    return loads(response.content)
+
+
+def assert_contains_all(container, expected, message="missing keys"):
+    """Assert every expected item is in the container (a mapping's keys or a set), listing all that are missing"""
+    missing = set(expected).difference(container)
+    assert not missing, f"{message}: {sorted(missing)}"
+
+
+def expect_json_ok(response, *keys, **must_contain):
+    """Assert a 200 response whose JSON body has the given keys and key/value pairs, and return the body."""
+    assert response.status_code == 200, response.text
+    data = read_json(response)
+    if keys:
+        assert_contains_all(data, keys)
+    if must_contain:
+        assert must_contain.items() <= data.items(), f"Expected {must_contain} in {data}"
+    return data
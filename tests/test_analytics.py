@@ -1,81 +1,67 @@
+import asyncio
 import pytest
 from httpx import AsyncClient
 from unittest.mock import patch, AsyncMock, MagicMock
 from datetime import datetime, timedelta
-import json
+
+from tests.helpers import assert_contains_all, expect_json_ok
+
+# Date bounds computed once at import
+_NOW = datetime.utcnow()
+_ISO_NOW = _NOW.isoformat()
+_ISO_7 = (_NOW - timedelta(days=7)).isoformat()
+_ISO_30 = (_NOW - timedelta(days=30)).isoformat()
+
+# Keys every analytics overview response must carry
+OVERVIEW_KEYS = {
+    "total_publications", "total_views", "total_engagement", "engagement_rate",
+    "platform_breakdown", "top_performing_content", "trends"
+}
+PLATFORM_METRIC_KEYS = {"publications", "views", "engagement", "engagement_rate"}
+TOP_CONTENT_KEYS = {"title", "platform", "views", "engagement", "engagement_rate", "published_at"}
+
+
+def extract(doc, pointer):
+    """Resolve a JSON Pointer (RFC 6901) such as "/summary/total_views" against decoded JSON"""
+    for token in pointer.split("/")[1:]:
+        token = token.replace("~1", "/").replace("~0", "~")
+        doc = doc[int(token)] if isinstance(doc, list) else doc[token]
+    return doc
+
+
+def _overview_payload(days=30, platforms=("youtube", "instagram", "facebook")):
+    """Build an analytics overview request body ending now"""
+    return {
+        "start_date": (_NOW - timedelta(days=days)).isoformat(),
+        "end_date": _ISO_NOW,
+        "platforms": list(platforms)
+    }
 
 
 class TestAnalytics:
     """Test analytics endpoints and functionality"""
 
-    @pytest.fixture
-    async def authenticated_client(self, client: AsyncClient):
-        """Get authenticated client with valid token"""
-        # Login to get token
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            params={"username": "admin", "password": "admin"}
-        )
-        
-        token_data = login_response.json()
-        access_token = token_data["access_token"]
-        
-        # Add auth header to client
-        client.headers.update({"Authorization": f"Bearer {access_token}"})
-        return client
-
     async def test_analytics_overview(self, authenticated_client: AsyncClient):
         """Test getting analytics overview"""
-        start_date = datetime.utcnow() - timedelta(days=30)
-        end_date = datetime.utcnow()
-        
-        request_data = {
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-            "platforms": ["youtube", "instagram", "facebook"]
-        }
-        
         response = await authenticated_client.post(
             "/api/v1/analytics/overview",
-            json=request_data
+            json=_overview_payload()
         )
         
-        assert response.status_code == 200
-        data = response.json()
-        
-        # Check required fields
-        assert "total_publications" in data
-        assert "total_views" in data
-        assert "total_engagement" in data
-        assert "engagement_rate" in data
-        assert "platform_breakdown" in data
-        assert "top_performing_content" in data
-        assert "trends" in data
+        data = expect_json_ok(response, *OVERVIEW_KEYS)
         
         # Check platform breakdown
-        platform_breakdown = data["platform_breakdown"]
-        assert "youtube" in platform_breakdown
-        assert "instagram" in platform_breakdown
-        assert "facebook" in platform_breakdown
+        assert_contains_all(extract(data, "/platform_breakdown"), {"youtube", "instagram", "facebook"}, "missing platforms")
         
         # Verify each platform has required metrics
-        for platform, metrics in platform_breakdown.items():
-            assert "publications" in metrics
-            assert "views" in metrics
-            assert "engagement" in metrics
-            assert "engagement_rate" in metrics
+        for platform in ("youtube", "instagram", "facebook"):
+            assert_contains_all(extract(data, f"/platform_breakdown/{platform}"), PLATFORM_METRIC_KEYS, f"{platform} missing keys")
         
         # Check top performing content structure
         top_content = data["top_performing_content"]
         assert isinstance(top_content, list)
         if top_content:
-            content_item = top_content[0]
-            assert "title" in content_item
-            assert "platform" in content_item
-            assert "views" in content_item
-            assert "engagement" in content_item
-            assert "engagement_rate" in content_item
-            assert "published_at" in content_item
+            assert_contains_all(top_content[0], TOP_CONTENT_KEYS, "missing keys")
 
     async def test_platform_specific_analytics(self, authenticated_client: AsyncClient):
         """Test getting analytics for a specific platform"""
@@ -87,29 +73,21 @@ class TestAnalytics:
             params={"days": days}
         )
         
-        assert response.status_code == 200
-        data = response.json()
-        
+        data = expect_json_ok(response, "platform", "period", "summary", "daily_stats", "top_posts")
         assert data["platform"] == platform
-        assert "period" in data
-        assert "summary" in data
-        assert "daily_stats" in data
-        assert "top_posts" in data
         
         # Check period information
-        period = data["period"]
-        assert period["days"] == days
-        assert "start_date" in period
-        assert "end_date" in period
+        assert extract(data, "/period/days") == days
+        assert_contains_all(extract(data, "/period"), {"start_date", "end_date"}, "missing period keys")
         
         # Check summary metrics
         summary = data["summary"]
-        required_summary_fields = [
+        required_summary_fields = {
             "total_posts", "total_views", "total_likes", 
             "total_comments", "total_shares", "average_engagement_rate"
-        ]
+        }
+        assert_contains_all(summary, required_summary_fields, "missing summary keys")
         for field in required_summary_fields:
-            assert field in summary
             assert isinstance(summary[field], (int, float))
         
         # Check daily stats structure
@@ -117,22 +95,16 @@ class TestAnalytics:
         assert isinstance(daily_stats, list)
         assert len(daily_stats) == days
         
+        daily_stat_keys = {"date", "posts", "views", "engagement"}
         for stat in daily_stats:
-            assert "date" in stat
-            assert "posts" in stat
-            assert "views" in stat
-            assert "engagement" in stat
+            assert_contains_all(stat, daily_stat_keys, "missing daily stat keys")
         
         # Check top posts structure
         top_posts = data["top_posts"]
         assert isinstance(top_posts, list)
+        top_post_keys = {"id", "title", "views", "engagement", "engagement_rate", "published_at"}
         for post in top_posts:
-            assert "id" in post
-            assert "title" in post
-            assert "views" in post
-            assert "engagement" in post
-            assert "engagement_rate" in post
-            assert "published_at" in post
+            assert_contains_all(post, top_post_keys, "missing post keys")
 
     async def test_content_specific_analytics(self, authenticated_client: AsyncClient):
         """Test getting analytics for specific content"""
@@ -142,40 +114,30 @@ class TestAnalytics:
             f"/api/v1/analytics/content/{content_id}"
         )
         
-        assert response.status_code == 200
-        data = response.json()
-        
+        data = expect_json_ok(
+            response, "content_id", "title", "created_at", "platforms",
+            "total_performance", "performance_over_time"
+        )
         assert data["content_id"] == content_id
-        assert "title" in data
-        assert "created_at" in data
-        assert "platforms" in data
-        assert "total_performance" in data
-        assert "performance_over_time" in data
         
         # Check platforms data
         platforms = data["platforms"]
+        platform_keys = {
+            "post_id", "views", "likes", "comments",
+            "shares", "engagement_rate", "published_at"
+        }
         for platform, metrics in platforms.items():
-            assert "post_id" in metrics
-            assert "views" in metrics
-            assert "likes" in metrics
-            assert "comments" in metrics
-            assert "shares" in metrics
-            assert "engagement_rate" in metrics
-            assert "published_at" in metrics
+            assert_contains_all(metrics, platform_keys, f"{platform} missing keys")
         
         # Check total performance
-        total_perf = data["total_performance"]
-        assert "total_views" in total_perf
-        assert "total_engagement" in total_perf
-        assert "average_engagement_rate" in total_perf
+        assert_contains_all(data["total_performance"], {"total_views", "total_engagement", "average_engagement_rate"}, "missing total performance keys")
         
         # Check performance over time
         perf_timeline = data["performance_over_time"]
         assert isinstance(perf_timeline, list)
+        point_keys = {"timestamp", "cumulative_views", "cumulative_engagement"}
         for point in perf_timeline:
-            assert "timestamp" in point
-            assert "cumulative_views" in point
-            assert "cumulative_engagement" in point
+            assert_contains_all(point, point_keys, "missing timeline keys")
 
     async def test_trends_analysis(self, authenticated_client: AsyncClient):
         """Test getting trends and insights"""
@@ -184,41 +146,34 @@ class TestAnalytics:
             params={"days": 30, "platform": "youtube"}
         )
         
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert "period" in data
-        assert "trending_topics" in data
-        assert "optimal_posting_times" in data
-        assert "content_performance_insights" in data
+        data = expect_json_ok(
+            response, "period", "trending_topics",
+            "optimal_posting_times", "content_performance_insights"
+        )
         
         # Check period info
-        period = data["period"]
-        assert period["days"] == 30
-        assert period["platform"] == "youtube"
+        assert extract(data, "/period/days") == 30
+        assert extract(data, "/period/platform") == "youtube"
         
         # Check trending topics
         trending_topics = data["trending_topics"]
         assert isinstance(trending_topics, list)
+        topic_keys = {"topic", "mentions", "average_engagement", "growth"}
         for topic in trending_topics:
-            assert "topic" in topic
-            assert "mentions" in topic
-            assert "average_engagement" in topic
-            assert "growth" in topic
+            assert_contains_all(topic, topic_keys, "missing topic keys")
         
         # Check optimal posting times
         posting_times = data["optimal_posting_times"]
         days_of_week = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+        assert_contains_all(posting_times, set(days_of_week), "missing days")
         for day in days_of_week:
-            assert day in posting_times
             assert isinstance(posting_times[day], list)
         
         # Check content performance insights
-        insights = data["content_performance_insights"]
-        assert "best_performing_duration" in insights
-        assert "best_performing_style" in insights
-        assert "most_engaging_hashtags" in insights
-        assert "audience_engagement_patterns" in insights
+        assert_contains_all(data["content_performance_insights"], {
+            "best_performing_duration", "best_performing_style",
+            "most_engaging_hashtags", "audience_engagement_patterns"
+        }, "missing insight keys")
 
     async def test_trends_analysis_all_platforms(self, authenticated_client: AsyncClient):
         """Test getting trends for all platforms"""
@@ -227,121 +182,69 @@ class TestAnalytics:
             params={"days": 7}  # No platform specified = all platforms
         )
         
-        assert response.status_code == 200
-        data = response.json()
+        data = expect_json_ok(response, "period")
         
-        period = data["period"]
-        assert period["days"] == 7
-        assert period["platform"] == "all"
+        assert extract(data, "/period/days") == 7
+        assert extract(data, "/period/platform") == "all"
 
     async def test_analytics_export(self, authenticated_client: AsyncClient):
         """Test exporting analytics data"""
-        start_date = datetime.utcnow() - timedelta(days=30)
-        end_date = datetime.utcnow()
-        
         response = await authenticated_client.get(
             "/api/v1/analytics/export",
             params={
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat(),
+                "start_date": _ISO_30,
+                "end_date": _ISO_NOW,
                 "format": "csv",
                 "platforms": ["youtube", "instagram"]
             }
         )
         
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert "export_id" in data
-        assert "format" in data
-        assert "status" in data
-        assert "download_url" in data
-        assert "estimated_completion" in data
+        data = expect_json_ok(
+            response, "export_id", "format", "status",
+            "download_url", "estimated_completion"
+        )
         
         assert data["format"] == "csv"
         assert data["status"] == "processing"
         assert data["export_id"].startswith("export_")
 
-    async def test_analytics_export_different_formats(self, authenticated_client: AsyncClient):
+    @pytest.mark.parametrize("export_format", ["csv", "json", "xlsx"])
+    async def test_analytics_export_different_formats(self, authenticated_client: AsyncClient, export_format):
         """Test exporting analytics in different formats"""
-        start_date = datetime.utcnow() - timedelta(days=7)
-        end_date = datetime.utcnow()
-        
-        formats = ["csv", "json", "xlsx"]
-        
-        for export_format in formats:
-            response = await authenticated_client.get(
-                "/api/v1/analytics/export",
-                params={
-                    "start_date": start_date.isoformat(),
-                    "end_date": end_date.isoformat(),
-                    "format": export_format
-                }
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["format"] == export_format
-
-    async def test_analytics_date_range_validation(self, authenticated_client: AsyncClient):
-        """Test analytics with various date ranges"""
-        # Test last 7 days
-        start_date = datetime.utcnow() - timedelta(days=7)
-        end_date = datetime.utcnow()
-        
-        request_data = {
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-            "platforms": ["youtube"]
-        }
-        
-        response = await authenticated_client.post(
-            "/api/v1/analytics/overview",
-            json=request_data
+        response = await authenticated_client.get(
+            "/api/v1/analytics/export",
+            params={
+                "start_date": _ISO_7,
+                "end_date": _ISO_NOW,
+                "format": export_format
+            }
         )
         
-        assert response.status_code == 200
-        
-        # Test last 90 days
-        start_date = datetime.utcnow() - timedelta(days=90)
-        request_data["start_date"] = start_date.isoformat()
-        
+        data = expect_json_ok(response, "format")
+        assert data["format"] == export_format
+
+    @pytest.mark.parametrize("days", [7, 90], ids=["7_days", "90_days"])
+    async def test_analytics_date_range_validation(self, authenticated_client: AsyncClient, days):
+        """Test analytics with various date ranges"""
         response = await authenticated_client.post(
             "/api/v1/analytics/overview",
-            json=request_data
+            json=_overview_payload(days, platforms=["youtube"])
         )
         
-        assert response.status_code == 200
+        expect_json_ok(response)
 
-    async def test_analytics_platform_filtering(self, authenticated_client: AsyncClient):
+    @pytest.mark.parametrize("platforms", [
+        ["youtube"],
+        ["youtube", "instagram", "facebook"]
+    ], ids=["single_platform", "multiple_platforms"])
+    async def test_analytics_platform_filtering(self, authenticated_client: AsyncClient, platforms):
         """Test analytics with platform filtering"""
-        start_date = datetime.utcnow() - timedelta(days=30)
-        end_date = datetime.utcnow()
-        
-        # Test single platform
-        request_data = {
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-            "platforms": ["youtube"]
-        }
-        
-        response = await authenticated_client.post(
-            "/api/v1/analytics/overview",
-            json=request_data
-        )
-        
-        assert response.status_code == 200
-        data = response.json()
-        
-        # Test multiple platforms
-        request_data["platforms"] = ["youtube", "instagram", "facebook"]
-        
         response = await authenticated_client.post(
             "/api/v1/analytics/overview",
-            json=request_data
+            json=_overview_payload(platforms=platforms)
         )
         
-        assert response.status_code == 200
+        expect_json_ok(response)
 
     async def test_analytics_error_handling(self, authenticated_client: AsyncClient):
         """Test error handling in analytics endpoints"""
@@ -365,22 +268,12 @@ class TestAnalytics:
     async def test_analytics_performance_metrics(self, authenticated_client: AsyncClient):
         """Test that analytics return consistent performance metrics"""
         # Get overview
-        start_date = datetime.utcnow() - timedelta(days=30)
-        end_date = datetime.utcnow()
-        
-        request_data = {
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-            "platforms": ["youtube", "instagram"]
-        }
-        
         response = await authenticated_client.post(
             "/api/v1/analytics/overview",
-            json=request_data
+            json=_overview_payload(platforms=["youtube", "instagram"])
         )
         
-        assert response.status_code == 200
-        overview_data = response.json()
+        overview_data = expect_json_ok(response, "total_views", "engagement_rate")
         
         # Get platform-specific data
         youtube_response = await authenticated_client.get(
@@ -388,26 +281,24 @@ class TestAnalytics:
             params={"days": 30}
         )
         
-        assert youtube_response.status_code == 200
-        youtube_data = youtube_response.json()
+        youtube_data = expect_json_ok(youtube_response, "summary")
         
         # Verify metric consistency (in a real implementation)
         # For mock data, just verify structure
-        assert "total_views" in overview_data
-        assert "total_views" in youtube_data["summary"]
+        assert "total_views" in extract(youtube_data, "/summary")
         
         # Verify engagement rate is within reasonable bounds
-        assert 0 <= overview_data["engagement_rate"] <= 100
-        assert 0 <= youtube_data["summary"]["average_engagement_rate"] <= 100
+        assert 0 <= extract(overview_data, "/engagement_rate") <= 100
+        assert 0 <= extract(youtube_data, "/summary/average_engagement_rate") <= 100
 
     async def test_authentication_required_for_analytics(self, client: AsyncClient):
         """Test that analytics endpoints require authentication"""
-        # Test without authentication token
-        response = await client.post("/api/v1/analytics/overview", json={})
-        assert response.status_code == 403
-        
-        response = await client.get("/api/v1/analytics/platforms/youtube")
-        assert response.status_code == 403
+        # Test without authentication token; the probes are independent, so send them together
+        responses = await asyncio.gather(
+            client.post("/api/v1/analytics/overview", json={}),
+            client.get("/api/v1/analytics/platforms/youtube"),
+            client.get("/api/v1/analytics/content/1"),
+        )
         
-        response = await client.get("/api/v1/analytics/content/1")
-        assert response.status_code == 403
\ No newline at end of file
+        for response in responses:
+            assert response.status_code == 403, response.request.url
\ No newline at end of file
@@ -2,6 +2,11 @@ import pytest
 from httpx import AsyncClient
 from unittest.mock import patch, AsyncMock
 import json
+from datetime import timedelta
+from jose import jwt
+from src.api.routers.auth import create_access_token, get_password_hash, register, verify_password
+from src.core.config import settings
+from src.schemas import UserCreate
 
 
 class TestAuthentication:
@@ -40,20 +45,19 @@ class TestAuthentication:
         assert "id" in data
         assert "created_at" in data
 
-    async def test_user_registration_duplicate_email(self, client: AsyncClient, sample_user_data):
+    async def test_user_registration_duplicate_email(self, client: AsyncClient, test_db, sample_user_data):
         """Test user registration with duplicate email"""
-        # Register first user
-        await client.post("/api/v1/auth/register", json=sample_user_data)
+        # Register first user in-process, on the same session the client uses
+        user = await register(UserCreate(**sample_user_data), db=test_db)
+        assert user.email == sample_user_data["email"]
         
         # Try to register again with same email
         duplicate_user = sample_user_data.copy()
         duplicate_user["username"] = "differentuser"
         
-        # Note: This would normally fail with 409 conflict in a real implementation
-        # The current mock implementation doesn't check for duplicates
         response = await client.post("/api/v1/auth/register", json=duplicate_user)
-        # For now, we expect it to succeed due to mock implementation
-        assert response.status_code == 200
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Email already registered"
 
     async def test_user_login_success(self, client: AsyncClient):
         """Test successful user login"""
@@ -102,19 +106,10 @@ class TestAuthentication:
         response = await client.get("/api/v1/auth/me", headers=headers)
         assert response.status_code == 401
 
-    async def test_get_current_user_with_valid_token(self, client: AsyncClient):
+    async def test_get_current_user_with_valid_token(self, client: AsyncClient, admin_token: str):
         """Test accessing protected endpoint with valid token"""
-        # First login to get a valid token
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            params={"username": "admin", "password": "admin"}
-        )
-        
-        token_data = login_response.json()
-        access_token = token_data["access_token"]
-        
         # Use the token to access protected endpoint
-        headers = {"Authorization": f"Bearer {access_token}"}
+        headers = {"Authorization": f"Bearer {admin_token}"}
         response = await client.get("/api/v1/auth/me", headers=headers)
         
         assert response.status_code == 200
@@ -123,19 +118,10 @@ class TestAuthentication:
         assert data["email"] == "user@example.com"
         assert data["is_active"] is True
 
-    async def test_token_refresh(self, client: AsyncClient):
+    async def test_token_refresh(self, client: AsyncClient, admin_token: str):
         """Test token refresh functionality"""
-        # First login to get a valid token
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            params={"username": "admin", "password": "admin"}
-        )
-        
-        token_data = login_response.json()
-        access_token = token_data["access_token"]
-        
         # Use the token to refresh
-        headers = {"Authorization": f"Bearer {access_token}"}
+        headers = {"Authorization": f"Bearer {admin_token}"}
         response = await client.post("/api/v1/auth/refresh", headers=headers)
         
         assert response.status_code == 200
@@ -143,31 +129,21 @@ class TestAuthentication:
         assert "access_token" in data
         assert data["token_type"] == "bearer"
         # Should get a new token
-        assert data["access_token"] != access_token
+        assert data["access_token"] != admin_token
 
-    async def test_user_logout(self, client: AsyncClient):
+    async def test_user_logout(self, client: AsyncClient, admin_token: str):
         """Test user logout"""
-        # First login to get a valid token
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            params={"username": "admin", "password": "admin"}
-        )
-        
-        token_data = login_response.json()
-        access_token = token_data["access_token"]
-        
         # Logout with the token
-        headers = {"Authorization": f"Bearer {access_token}"}
+        headers = {"Authorization": f"Bearer {admin_token}"}
         response = await client.post("/api/v1/auth/logout", headers=headers)
         
         assert response.status_code == 200
         data = response.json()
         assert data["message"] == "Successfully logged out"
 
+    @pytest.mark.usefixtures("fast_password_hashing")
     async def test_password_hash_verification(self):
         """Test password hashing and verification"""
-        from src.api.routers.auth import get_password_hash, verify_password
-        
         password = "test_password123"
         hashed = get_password_hash(password)
         
@@ -182,11 +158,6 @@ class TestAuthentication:
 
     async def test_jwt_token_creation_and_decode(self):
         """Test JWT token creation and decoding"""
-        from src.api.routers.auth import create_access_token
-        from jose import jwt
-        from src.core.config import settings
-        from datetime import timedelta
-        
         # Create token
         test_data = {"sub": "testuser"}
         token = create_access_token(test_data, expires_delta=timedelta(minutes=30))
@@ -1,8 +1,9 @@
 """
 Test cases for health check and performance monitoring.
 """
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
 from src.utils.test_utils import (
@@ -10,14 +11,15 @@ from src.utils.test_utils import (
     assert_success_response,
     PerformanceTestRunner
 )
+from tests.helpers import rate_limiters
 
 
 class TestHealthChecks:
     """Test health check endpoints."""
     
-    def test_basic_health_check(self, client: TestClient):
+    async def test_basic_health_check(self, async_client: AsyncClient):
         """Test basic health check endpoint."""
-        response = client.get("/health")
+        response = await async_client.get("/health")
         assert response.status_code == 200
         
         data = response.json()
@@ -25,16 +27,15 @@ class TestHealthChecks:
         assert_response_structure(data, required_fields)
         assert data["status"] == "healthy"
     
-    def test_root_endpoint(self, client: TestClient):
+    async def test_root_endpoint(self, async_client: AsyncClient):
         """Test root endpoint."""
-        response = client.get("/")
+        response = await async_client.get("/")
         assert response.status_code == 200
         
         data = response.json()
         required_fields = ["message", "status", "version"]
         assert_response_structure(data, required_fields)
     
-    @pytest.mark.asyncio
     async def test_detailed_health_check(self, async_client: AsyncClient):
         """Test detailed health check endpoint."""
         response = await async_client.get("/health/detailed")
@@ -49,7 +50,6 @@ class TestHealthChecks:
         # Check components structure
         assert isinstance(data["components"], dict)
     
-    @pytest.mark.asyncio
     async def test_readiness_check(self, async_client: AsyncClient):
         """Test readiness check endpoint."""
         response = await async_client.get("/health/ready")
@@ -60,7 +60,6 @@ class TestHealthChecks:
         data = response.json()
         assert "ready" in data or "failed_component" in data
     
-    @pytest.mark.asyncio
     async def test_liveness_check(self, async_client: AsyncClient):
         """Test liveness check endpoint."""
         response = await async_client.get("/health/live")
@@ -75,7 +74,6 @@ class TestHealthChecks:
 class TestPerformance:
     """Performance tests for critical endpoints."""
     
-    @pytest.mark.asyncio
     async def test_health_check_performance(self, performance_runner: PerformanceTestRunner):
         """Test health check endpoint performance under load."""
         # Run 20 concurrent requests
@@ -95,7 +93,6 @@ class TestPerformance:
         # Success rate should be 100%
         assert summary["success_rate_percent"] == 100.0
     
-    @pytest.mark.asyncio
     async def test_root_endpoint_performance(self, performance_runner: PerformanceTestRunner):
         """Test root endpoint performance."""
         results = await performance_runner.run_concurrent_requests("/", count=10)
@@ -111,9 +108,9 @@ class TestPerformance:
 class TestSecurityMiddleware:
     """Test security middleware functionality."""
     
-    def test_security_headers(self, client: TestClient):
+    async def test_security_headers(self, async_client: AsyncClient):
         """Test that security headers are added to responses."""
-        response = client.get("/health")
+        response = await async_client.get("/health")
         
         # Check for security headers
         expected_headers = [
@@ -126,26 +123,37 @@ class TestSecurityMiddleware:
         for header in expected_headers:
             assert header in response.headers, f"Missing security header: {header}"
     
-    def test_rate_limiting_headers(self, client: TestClient):
+    async def test_rate_limiting_headers(self, async_client: AsyncClient):
         """Test rate limiting behavior."""
-        # Make multiple requests quickly
-        responses = []
-        for i in range(5):
-            response = client.get("/health")
-            responses.append(response)
+        # Make multiple requests as one burst
+        responses = await asyncio.gather(*(async_client.get("/health") for _ in range(5)))
         
         # All should succeed (under rate limit)
-        for response in responses:
-            assert response.status_code == 200
+        assert [response.status_code for response in responses] == [200] * 5
+    
+    async def test_rate_limit_budget_is_per_test(self, app, async_client: AsyncClient):
+        """Test that no earlier test's requests count against this one under xdist"""
+        response = await async_client.get("/health")
+        assert response.status_code == 200
+        
+        limiters = list(rate_limiters(app))
+        assert limiters, "RateLimitMiddleware not found in the middleware stack"
+        for limiter in limiters:
+            assert sum(len(hits) for hits in limiter.clients.values()) == 1
     
-    def test_large_request_rejection(self, client: TestClient):
+    async def test_large_request_rejection(self, async_client: AsyncClient):
         """Test that large requests are rejected."""
-        # Create a large payload (this would normally be rejected by the middleware)
-        large_data = {"data": "x" * (11 * 1024 * 1024)}  # 11MB
+        # Create a large payload (this would normally be rejected by the middleware);
+        # built directly as JSON bytes so the 11MB body isn't also serialized by json.dumps
+        large_body = b'{"data": "' + b"x" * (11 * 1024 * 1024) + b'"}'  # 11MB
         
         # Note: This test may not work exactly as expected since the test client
         # doesn't fully simulate the middleware. In a real scenario, this would be rejected.
-        response = client.post("/api/v1/content/generate", json=large_data)
+        response = await async_client.post(
+            "/api/v1/content/generate",
+            content=large_body,
+            headers={"Content-Type": "application/json"}
+        )
         
         # The response should indicate some kind of error (422 for validation, 413 for size)
         assert response.status_code in [413, 422, 400]
@@ -155,15 +163,15 @@ class TestSecurityMiddleware:
 class TestInputValidation:
     """Test input validation functionality."""
     
-    def test_content_generation_validation(self, client: TestClient, sample_content_data: dict):
+    async def test_content_generation_validation(self, async_client: AsyncClient, sample_content_data):
         """Test content generation request validation."""
         # Test valid request
-        response = client.post("/api/v1/content/generate", json=sample_content_data)
+        response = await async_client.post("/api/v1/content/generate", json=dict(sample_content_data))
         # Note: This may fail if the endpoint isn't fully implemented
         # but validation should pass
         assert response.status_code in [200, 201, 404, 501]  # Allow for various implementation states
     
-    def test_invalid_platform_validation(self, client: TestClient):
+    async def test_invalid_platform_validation(self, async_client: AsyncClient):
         """Test validation of invalid platforms."""
         invalid_data = {
             "title": "Test",
@@ -172,17 +180,17 @@ class TestInputValidation:
             "target_platforms": ["invalid_platform"]
         }
         
-        response = client.post("/api/v1/content/generate", json=invalid_data)
+        response = await async_client.post("/api/v1/content/generate", json=invalid_data)
         assert response.status_code in [400, 422]  # Should be validation error
     
-    def test_missing_required_fields(self, client: TestClient):
+    async def test_missing_required_fields(self, async_client: AsyncClient):
         """Test validation with missing required fields."""
         invalid_data = {
             "title": "Test"
             # Missing required fields
         }
         
-        response = client.post("/api/v1/content/generate", json=invalid_data)
+        response = await async_client.post("/api/v1/content/generate", json=invalid_data)
         assert response.status_code in [400, 422]  # Should be validation error
 
 
@@ -0,0 +1,54 @@
+"""
+Test cases guarding import-time cost of test modules.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def loaded_modules_after_import(module_name: str) -> set:
+    """Import a module in a fresh interpreter and return the modules it loaded."""
+    script = (
+        "import sys\n"
+        "before = set(sys.modules)\n"
+        f"import {module_name}\n"
+        "print('\\n'.join(sorted(set(sys.modules) - before)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestImportTime:
+    """Test that heavy subsystems are only imported when used."""
+
+    def test_workflow_script_import_is_lazy(self):
+        """Importing test_workflows must not pull in the workflow or automation subsystems."""
+        loaded = loaded_modules_after_import("test_workflows")
+
+        heavy = {
+            name for name in loaded
+            if name.split(".")[0] in {"workflows", "automation", "connectors", "studio"}
+        }
+        assert not heavy, f"Eagerly imported: {sorted(heavy)}"
+
+    def test_conftest_import_does_not_load_app(self):
+        """Importing the shared fixtures must not import the FastAPI app or any src module."""
+        loaded = loaded_modules_after_import("tests.conftest")
+
+        eager = {name for name in loaded if name == "src" or name.startswith("src.")}
+        assert not eager, f"Eagerly imported: {sorted(eager)}"
+
+    def test_helpers_import_does_not_load_app(self):
+        """Importing the shared assertion helpers must not import the FastAPI app or any src module."""
+        loaded = loaded_modules_after_import("tests.helpers")
+
+        eager = {name for name in loaded if name == "src" or name.startswith("src.")}
+        assert not eager, f"Eagerly imported: {sorted(eager)}"
@@ -1,148 +1,167 @@
 import pytest
 from httpx import AsyncClient
-from unittest.mock import patch, AsyncMock, MagicMock
-import tempfile
+from unittest.mock import patch, MagicMock
 import os
-import json
 import asyncio
+from types import MappingProxyType, SimpleNamespace
+from datetime import datetime, timedelta
+from typing import Generator
+from src.api.routers.auth import get_current_user
+from src.schemas import User
+from tests.helpers import read_json
+
+# Patch the service methods for every test here, not only from the first test that asks for them
+pytestmark = pytest.mark.usefixtures("patched_services")
+
+
+# Stands in for the logged-in admin on routes that depend on get_current_user
+ADMIN_USER = User(
+    id=1,
+    email="user@example.com",
+    username="admin",
+    is_active=True,
+    is_superuser=False,
+    created_at=datetime(2024, 1, 1)
+)
+
+
+@pytest.fixture
+def authenticated_client(app, client: AsyncClient) -> Generator[AsyncClient, None, None]:
+    """Act as the admin user without logging in or decoding a JWT per request"""
+    app.dependency_overrides[get_current_user] = lambda: ADMIN_USER
+    
+    yield client
+    
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+# Canned service output for the content workflow; each step is exercised on its own
+SCRIPT_DATA = {
+    "script": "Welcome to our comprehensive guide on AI content creation. In this video, we'll explore how artificial intelligence is revolutionizing the way we create engaging social media content.",
+    "title_suggestions": [
+        "AI Content Creation: The Complete Guide",
+        "How to Create Viral Content with AI",
+        "Master AI Content Creation in 2024"
+    ],
+    "duration": 60,
+    "word_count": 150,
+    "metadata": {"style": "educational", "platform": "youtube"}
+}
+TITLE = SCRIPT_DATA["title_suggestions"][0]
+DESCRIPTION = "Learn how to leverage AI for creating engaging social media content. This comprehensive guide covers everything from script generation to video creation and publishing automation."
+HASHTAGS = [
+    "#AI", "#ContentCreation", "#SocialMedia", "#YouTube", 
+    "#Automation", "#DigitalMarketing", "#VideoMarketing", "#Tech"
+]
+
+# (service mock, method, url, request kwargs, mock return, response key wrapping the return)
+WORKFLOW_STEPS = [
+    pytest.param(
+        "script", "POST", "/api/v1/content/script",
+        {"params": {
+            "topic": "AI content creation guide",
+            "style": "educational",
+            "duration": 60,
+            "platform": "youtube"
+        }},
+        SCRIPT_DATA, None,
+        id="script"
+    ),
+    pytest.param(
+        "speech", "POST", "/api/v1/content/voice",
+        {"params": {
+            "text": SCRIPT_DATA["script"],
+            "voice_id": "test_voice_id",
+            "stability": 0.5,
+            "similarity_boost": 0.75
+        }},
+        "audio.mp3", "audio_path",
+        id="voice"
+    ),
+    pytest.param(
+        "video", "POST", "/api/v1/content/video",
+        {"json": {
+            "script_data": SCRIPT_DATA,
+            "audio_path": "/tmp/generated_content/audio_123.mp3",
+            "video_config": {"resolution": "1080p", "fps": 30}
+        }},
+        "video.mp4", "video_path",
+        id="video"
+    ),
+    pytest.param(
+        "description", "POST", "/api/v1/content/description",
+        {"params": {"title": TITLE, "script": SCRIPT_DATA["script"], "platform": "youtube"}},
+        DESCRIPTION, None,
+        id="description"
+    ),
+    pytest.param(
+        "hashtags", "POST", "/api/v1/content/hashtags",
+        {"params": {"topic": "AI content creation", "platform": "youtube", "count": 8}},
+        HASHTAGS, None,
+        id="hashtags"
+    ),
+    pytest.param(
+        "platform_analytics", "GET", "/api/v1/platforms/analytics/youtube/youtube_123",
+        {},
+        {
+            "platform": "youtube",
+            "post_id": "youtube_123",
+            "views": 5000,
+            "likes": 250,
+            "comments": 15,
+            "shares": 8,
+            "engagement_rate": 5.46
+        }, None,
+        id="analytics"
+    ),
+]
+
+# Shared by every request in the concurrent test; the mock return is read-only
+_SCRIPT_PARAMS_BASE = {"style": "educational"}
+_MOCK_SCRIPT_RETURN = MappingProxyType({
+    "script": "Generated script content",
+    "title_suggestions": ["Title 1", "Title 2"],
+    "duration": 60
+})
 
 
 class TestIntegrationWorkflow:
     """Test complete end-to-end workflows of the social media automation platform"""
 
-    @pytest.fixture
-    async def authenticated_client(self, client: AsyncClient):
-        """Get authenticated client with valid token"""
-        # Login to get token
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            params={"username": "admin", "password": "admin"}
-        )
+    @pytest.mark.parametrize(
+        "service,method,url,request_kwargs,mock_return,response_key", WORKFLOW_STEPS
+    )
+    async def test_content_generation_and_publishing_workflow_step(
+        self, authenticated_client: AsyncClient, mock_api_keys, prebuilt_media, mock_services,
+        service, method, url, request_kwargs, mock_return, response_key
+    ):
+        """Test each step of the workflow from content generation to analytics in isolation"""
+        if response_key:
+            # Media steps hand back the placeholder files
+            mock_return = str(prebuilt_media / mock_return)
+        mock = getattr(mock_services, service)
+        mock.return_value = mock_return
         
-        token_data = login_response.json()
-        access_token = token_data["access_token"]
+        response = await authenticated_client.request(method, url, **request_kwargs)
         
-        # Add auth header to client
-        client.headers.update({"Authorization": f"Bearer {access_token}"})
-        return client
-
-    async def test_complete_content_generation_and_publishing_workflow(
-        self, authenticated_client: AsyncClient, mock_api_keys, temp_content_dir
+        assert response.status_code == 200
+        data = read_json(response)
+        assert data == ({response_key: mock_return} if response_key else mock_return)
+        mock.assert_awaited_once()
+        if response_key:
+            assert os.path.exists(data[response_key])
+
+    async def test_publishing_workflow(
+        self, authenticated_client: AsyncClient, mock_api_keys, prebuilt_media
     ):
-        """Test the complete workflow from content generation to publishing"""
-        
-        # Step 1: Generate script
-        with patch('src.services.ai_content_generator.AIContentGenerator.generate_script') as mock_script:
-            mock_script.return_value = {
-                "script": "Welcome to our comprehensive guide on AI content creation. In this video, we'll explore how artificial intelligence is revolutionizing the way we create engaging social media content.",
-                "title_suggestions": [
-                    "AI Content Creation: The Complete Guide",
-                    "How to Create Viral Content with AI",
-                    "Master AI Content Creation in 2024"
-                ],
-                "duration": 60,
-                "word_count": 150,
-                "metadata": {"style": "educational", "platform": "youtube"}
-            }
-            
-            script_response = await authenticated_client.post(
-                "/api/v1/content/script",
-                params={
-                    "topic": "AI content creation guide",
-                    "style": "educational",
-                    "duration": 60,
-                    "platform": "youtube"
-                }
-            )
-            
-            assert script_response.status_code == 200
-            script_data = script_response.json()
-            script_text = script_data["script"]
-            title = script_data["title_suggestions"][0]
-
-        # Step 2: Generate voice audio
-        with patch('src.services.voice_generator.VoiceGenerator.generate_speech') as mock_voice:
-            audio_path = os.path.join(temp_content_dir, "generated_audio.mp3")
-            with open(audio_path, 'w') as f:
-                f.write("mock audio content")
-            
-            mock_voice.return_value = audio_path
-            
-            voice_response = await authenticated_client.post(
-                "/api/v1/content/voice",
-                params={
-                    "text": script_text,
-                    "voice_id": "test_voice_id",
-                    "stability": 0.5,
-                    "similarity_boost": 0.75
-                }
-            )
-            
-            assert voice_response.status_code == 200
-            voice_data = voice_response.json()
-            generated_audio_path = voice_data["audio_path"]
-
-        # Step 3: Create video
-        with patch('src.services.video_processor.VideoProcessor.create_video_from_script') as mock_video:
-            video_path = os.path.join(temp_content_dir, "generated_video.mp4")
-            with open(video_path, 'w') as f:
-                f.write("mock video content")
-            
-            mock_video.return_value = video_path
-            
-            video_response = await authenticated_client.post(
-                "/api/v1/content/video",
-                json={
-                    "script_data": script_data,
-                    "audio_path": generated_audio_path,
-                    "video_config": {"resolution": "1080p", "fps": 30}
-                }
-            )
-            
-            assert video_response.status_code == 200
-            video_data = video_response.json()
-            generated_video_path = video_data["video_path"]
-
-        # Step 4: Generate additional content metadata
-        with patch('src.services.ai_content_generator.AIContentGenerator.generate_description') as mock_desc:
-            mock_desc.return_value = "Learn how to leverage AI for creating engaging social media content. This comprehensive guide covers everything from script generation to video creation and publishing automation."
-            
-            desc_response = await authenticated_client.post(
-                "/api/v1/content/description",
-                params={
-                    "title": title,
-                    "script": script_text,
-                    "platform": "youtube"
-                }
-            )
-            
-            assert desc_response.status_code == 200
-            description = desc_response.json()
-
-        with patch('src.services.ai_content_generator.AIContentGenerator.generate_hashtags') as mock_hashtags:
-            mock_hashtags.return_value = [
-                "#AI", "#ContentCreation", "#SocialMedia", "#YouTube", 
-                "#Automation", "#DigitalMarketing", "#VideoMarketing", "#Tech"
-            ]
-            
-            hashtags_response = await authenticated_client.post(
-                "/api/v1/content/hashtags",
-                params={
-                    "topic": "AI content creation",
-                    "platform": "youtube",
-                    "count": 8
-                }
-            )
-            
-            assert hashtags_response.status_code == 200
-            hashtags = hashtags_response.json()
-
-        # Step 5: Publish to multiple platforms
+        """Test publishing generated content to multiple platforms and tracking the task"""
+        
+        # Publish to multiple platforms
         content_data = {
-            "title": title,
-            "description": description,
+            "title": TITLE,
+            "description": DESCRIPTION,
             "tags": ["AI", "content", "creation", "automation"],
-            "hashtags": hashtags
+            "hashtags": HASHTAGS
         }
         
         with patch('src.tasks.social_publishing.publish_content_task.delay') as mock_publish_task:
@@ -151,22 +170,19 @@ class TestIntegrationWorkflow:
             publish_response = await authenticated_client.post(
                 "/api/v1/platforms/publish",
                 params={
-                    "video_path": generated_video_path,
+                    "video_path": str(prebuilt_media / "video.mp4"),
                     "platforms": ["youtube", "instagram"],
                     "content_data": content_data
                 }
             )
             
             assert publish_response.status_code == 200
-            publish_data = publish_response.json()
+            publish_data = read_json(publish_response)
             task_id = publish_data["task_id"]
 
-        # Step 6: Check task status
+        # Check task status
         with patch('src.core.celery_app.celery_app') as mock_celery:
-            mock_result = MagicMock()
-            mock_result.status = "SUCCESS"
-            mock_result.ready.return_value = True
-            mock_result.result = {
+            publish_result = {
                 "youtube": {
                     "post_id": "youtube_123",
                     "url": "https://youtube.com/watch?v=youtube_123",
@@ -178,42 +194,20 @@ class TestIntegrationWorkflow:
                     "status": "published"
                 }
             }
+            mock_result = SimpleNamespace(
+                status="SUCCESS", ready=lambda: True, result=publish_result, info=publish_result
+            )
             
             mock_celery.AsyncResult.return_value = mock_result
             
             task_response = await authenticated_client.get(f"/api/v1/content/task/{task_id}")
             
             assert task_response.status_code == 200
-            task_data = task_response.json()
+            task_data = read_json(task_response)
             assert task_data["status"] == "SUCCESS"
             assert "youtube" in task_data["result"]
             assert "instagram" in task_data["result"]
 
-        # Step 7: Get analytics
-        with patch('src.services.social_publisher.SocialMediaPublisher.get_platform_analytics') as mock_analytics:
-            mock_analytics.return_value = {
-                "platform": "youtube",
-                "post_id": "youtube_123",
-                "views": 5000,
-                "likes": 250,
-                "comments": 15,
-                "shares": 8,
-                "engagement_rate": 5.46
-            }
-            
-            analytics_response = await authenticated_client.get(
-                "/api/v1/platforms/analytics/youtube/youtube_123"
-            )
-            
-            assert analytics_response.status_code == 200
-            analytics_data = analytics_response.json()
-            assert analytics_data["views"] > 0
-            assert analytics_data["engagement_rate"] > 0
-
-        # Verify all files were created in temp directory
-        assert os.path.exists(generated_audio_path)
-        assert os.path.exists(generated_video_path)
-
     async def test_automated_content_generation_workflow(
         self, authenticated_client: AsyncClient, mock_api_keys, temp_content_dir
     ):
@@ -240,36 +234,13 @@ class TestIntegrationWorkflow:
             )
             
             assert generation_response.status_code == 200
-            gen_data = generation_response.json()
+            gen_data = read_json(generation_response)
             assert gen_data["status"] == "processing"
             task_id = gen_data["task_id"]
 
-        # Mock checking task progress
+        # Mock the finished task directly; the pending state is covered by the content tests
         with patch('src.core.celery_app.celery_app') as mock_celery:
-            # First check - in progress
-            mock_result = MagicMock()
-            mock_result.status = "PENDING"
-            mock_result.ready.return_value = False
-            mock_result.info = {
-                "progress": 50,
-                "current_step": "generating_video",
-                "steps_completed": ["script_generation", "voice_generation"],
-                "steps_remaining": ["video_creation", "optimization"]
-            }
-            
-            mock_celery.AsyncResult.return_value = mock_result
-            
-            progress_response = await authenticated_client.get(f"/api/v1/content/task/{task_id}")
-            
-            assert progress_response.status_code == 200
-            progress_data = progress_response.json()
-            assert progress_data["status"] == "PENDING"
-            assert "progress" in progress_data
-
-            # Second check - completed
-            mock_result.status = "SUCCESS"
-            mock_result.ready.return_value = True
-            mock_result.result = {
+            task_result = {
                 "video_path": os.path.join(temp_content_dir, "complete_video.mp4"),
                 "audio_path": os.path.join(temp_content_dir, "complete_audio.mp3"),
                 "script": "Complete generated script about AI social media automation...",
@@ -281,24 +252,29 @@ class TestIntegrationWorkflow:
                     "word_count": 135
                 }
             }
+            mock_result = SimpleNamespace(
+                status="SUCCESS", ready=lambda: True, result=task_result, info=task_result
+            )
+            
+            mock_celery.AsyncResult.return_value = mock_result
             
             completion_response = await authenticated_client.get(f"/api/v1/content/task/{task_id}")
             
             assert completion_response.status_code == 200
-            completion_data = completion_response.json()
+            completion_data = read_json(completion_response)
             assert completion_data["status"] == "SUCCESS"
             assert "video_path" in completion_data["result"]
             assert "metadata" in completion_data["result"]
 
     async def test_platform_connection_and_account_management(
-        self, authenticated_client: AsyncClient, mock_api_keys
+        self, authenticated_client: AsyncClient, mock_api_keys, mock_services
     ):
         """Test managing social media accounts and platform connections"""
         
         # Step 1: Check initial platform status
         status_response = await authenticated_client.get("/api/v1/platforms/platforms/status")
         assert status_response.status_code == 200
-        initial_status = status_response.json()
+        initial_status = read_json(status_response)
         
         # All platforms should initially be disconnected
         for platform in ["youtube", "facebook", "instagram", "tiktok"]:
@@ -323,14 +299,14 @@ class TestIntegrationWorkflow:
         )
         
         assert create_response.status_code == 200
-        created_account = create_response.json()
+        created_account = read_json(create_response)
         assert created_account["platform"] == "youtube"
         account_id = created_account["id"]
 
         # Step 3: Get accounts list
         accounts_response = await authenticated_client.get("/api/v1/platforms/accounts")
         assert accounts_response.status_code == 200
-        accounts = accounts_response.json()
+        accounts = read_json(accounts_response)
         assert isinstance(accounts, list)
 
         # Step 4: Update account
@@ -345,46 +321,43 @@ class TestIntegrationWorkflow:
         )
         
         assert update_response.status_code == 200
-        updated_account = update_response.json()
+        updated_account = read_json(update_response)
         assert updated_account["id"] == account_id
 
         # Step 5: Test publishing with connected account
         temp_video = "/tmp/test_video.mp4"
         
-        with patch('src.services.social_publisher.SocialMediaPublisher.publish_to_youtube') as mock_publish:
-            mock_publish.return_value = {
-                "platform": "youtube",
-                "post_id": "youtube_published_123",
-                "url": "https://youtube.com/watch?v=youtube_published_123",
-                "status": "published"
-            }
-            
-            publish_response = await authenticated_client.post(
-                "/api/v1/platforms/publish/youtube",
-                params={
-                    "video_path": temp_video,
-                    "content_data": {
-                        "title": "Test Video",
-                        "description": "Test Description",
-                        "tags": ["test"]
-                    }
+        mock_services.publish_youtube.return_value = {
+            "platform": "youtube",
+            "post_id": "youtube_published_123",
+            "url": "https://youtube.com/watch?v=youtube_published_123",
+            "status": "published"
+        }
+        
+        publish_response = await authenticated_client.post(
+            "/api/v1/platforms/publish/youtube",
+            params={
+                "video_path": temp_video,
+                "content_data": {
+                    "title": "Test Video",
+                    "description": "Test Description",
+                    "tags": ["test"]
                 }
-            )
-            
-            assert publish_response.status_code == 200
+            }
+        )
+        
+        assert publish_response.status_code == 200
 
         # Step 6: Delete account
         delete_response = await authenticated_client.delete(f"/api/v1/platforms/accounts/{account_id}")
         assert delete_response.status_code == 200
-        assert delete_response.json()["message"] == "Account deleted successfully"
+        assert read_json(delete_response)["message"] == "Account deleted successfully"
 
     async def test_analytics_and_reporting_workflow(
         self, authenticated_client: AsyncClient, mock_api_keys
     ):
         """Test comprehensive analytics and reporting workflow"""
         
-        from datetime import datetime, timedelta
-        
         # Step 1: Get overall analytics overview
         start_date = datetime.utcnow() - timedelta(days=30)
         end_date = datetime.utcnow()
@@ -401,7 +374,7 @@ class TestIntegrationWorkflow:
         )
         
         assert overview_response.status_code == 200
-        overview_data = overview_response.json()
+        overview_data = read_json(overview_response)
         
         total_views = overview_data["total_views"]
         total_engagement = overview_data["total_engagement"]
@@ -415,12 +388,12 @@ class TestIntegrationWorkflow:
             )
             
             assert platform_response.status_code == 200
-            platform_analytics[platform] = platform_response.json()
+            platform_analytics[platform] = read_json(platform_response)
 
         # Step 3: Get content-specific analytics
         content_response = await authenticated_client.get("/api/v1/analytics/content/123")
         assert content_response.status_code == 200
-        content_analytics = content_response.json()
+        content_analytics = read_json(content_response)
         
         # Step 4: Get trends analysis
         trends_response = await authenticated_client.get(
@@ -429,7 +402,7 @@ class TestIntegrationWorkflow:
         )
         
         assert trends_response.status_code == 200
-        trends_data = trends_response.json()
+        trends_data = read_json(trends_response)
         
         # Verify trends contain actionable insights
         assert "trending_topics" in trends_data
@@ -448,7 +421,7 @@ class TestIntegrationWorkflow:
         )
         
         assert export_response.status_code == 200
-        export_data = export_response.json()
+        export_data = read_json(export_response)
         assert "export_id" in export_data
         assert export_data["format"] == "csv"
 
@@ -464,19 +437,18 @@ class TestIntegrationWorkflow:
             assert platform_views > 0
 
     async def test_error_handling_and_recovery(
-        self, authenticated_client: AsyncClient, mock_api_keys
+        self, authenticated_client: AsyncClient, real_services
     ):
         """Test error handling and recovery scenarios"""
         
-        # Test 1: API key validation
-        # Remove mock API keys to test error handling
-        with patch.object(settings, 'OPENAI_API_KEY', ''):
-            script_response = await authenticated_client.post(
-                "/api/v1/content/script",
-                params={"topic": "test topic"}
-            )
-            # Should handle missing API key gracefully
-            assert script_response.status_code in [200, 400, 500]
+        # Test 1: Script generation failure
+        # The real generator runs, and no OpenAI key is stored for this user
+        script_response = await authenticated_client.post(
+            "/api/v1/content/script",
+            params={"topic": "test topic"}
+        )
+        # Should turn the service error into an error response
+        assert script_response.status_code in [400, 500]
 
         # Test 2: Invalid file paths
         invalid_video_path = "/nonexistent/path/video.mp4"
@@ -503,40 +475,37 @@ class TestIntegrationWorkflow:
         assert malformed_response.status_code in [400, 422, 500]
 
     async def test_concurrent_operations(
-        self, authenticated_client: AsyncClient, mock_api_keys
+        self, authenticated_client: AsyncClient, mock_api_keys, mock_services
     ):
         """Test handling of concurrent operations"""
         
-        # Create multiple concurrent content generation requests
+        # Create multiple concurrent content generation requests; the client fixture
+        # resets the rate limiter, so all 50 fit in its per-test budget of 100
         async def generate_content(topic):
-            response = await authenticated_client.post(
+            return await authenticated_client.post(
                 "/api/v1/content/script",
-                params={
-                    "topic": f"AI content about {topic}",
-                    "style": "educational"
-                }
+                params={**_SCRIPT_PARAMS_BASE, "topic": f"AI content about {topic}"}
             )
-            return response
 
         # Mock the AI service to handle concurrent requests
-        with patch('src.services.ai_content_generator.AIContentGenerator.generate_script') as mock_script:
-            mock_script.return_value = {
-                "script": "Generated script content",
-                "title_suggestions": ["Title 1", "Title 2"],
-                "duration": 60
-            }
-            
-            topics = ["machine learning", "social media", "automation", "AI tools", "content creation"]
-            
-            # Run concurrent requests
-            tasks = [generate_content(topic) for topic in topics]
-            responses = await asyncio.gather(*tasks)
-            
-            # All requests should succeed
-            for response in responses:
-                assert response.status_code == 200
-                data = response.json()
-                assert "script" in data
+        mock_services.script.return_value = _MOCK_SCRIPT_RETURN
+        
+        topics = [
+            f"{subject} #{i}"
+            for i in range(10)
+            for subject in ["machine learning", "social media", "automation", "AI tools", "content creation"]
+        ]
+        
+        # Run concurrent requests
+        tasks = [generate_content(topic) for topic in topics]
+        responses = await asyncio.gather(*tasks)
+        
+        # All requests should succeed, each served by the one shared mock
+        for response in responses:
+            assert response.status_code == 200
+            data = read_json(response)
+            assert "script" in data
+        assert mock_services.script.await_count == len(topics)
 
     async def test_user_session_management(self, client: AsyncClient):
         """Test user session and authentication management"""
@@ -548,7 +517,7 @@ class TestIntegrationWorkflow:
         )
         
         assert login_response.status_code == 200
-        login_data = login_response.json()
+        login_data = read_json(login_response)
         access_token = login_data["access_token"]
 
         # Test 2: Use token to access protected resource
@@ -556,13 +525,13 @@ class TestIntegrationWorkflow:
         
         me_response = await client.get("/api/v1/auth/me", headers=headers)
         assert me_response.status_code == 200
-        user_data = me_response.json()
+        user_data = read_json(me_response)
         assert user_data["username"] == "admin"
 
         # Test 3: Refresh token
         refresh_response = await client.post("/api/v1/auth/refresh", headers=headers)
         assert refresh_response.status_code == 200
-        refresh_data = refresh_response.json()
+        refresh_data = read_json(refresh_response)
         new_token = refresh_data["access_token"]
         assert new_token != access_token
 
@@ -574,4 +543,4 @@ class TestIntegrationWorkflow:
         # Test 5: Logout
         logout_response = await client.post("/api/v1/auth/logout", headers=new_headers)
         assert logout_response.status_code == 200
-        assert logout_response.json()["message"] == "Successfully logged out"
\ No newline at end of file
+        assert read_json(logout_response)["message"] == "Successfully logged out"
\ No newline at end of file
@@ -1,30 +1,65 @@
 import pytest
+import pytest_asyncio
+from dataclasses import asdict, dataclass
 from httpx import AsyncClient
-from unittest.mock import patch, AsyncMock, MagicMock
-import json
-import tempfile
-import os
+from unittest.mock import patch, MagicMock
+
+from tests.helpers import assert_contains_all
+
+# Patch the service methods for every test here, not only from the first test that asks for them
+pytestmark = pytest.mark.usefixtures("patched_services")
+
+
+# Platforms the status endpoint must always report on
+EXPECTED_PLATFORMS = frozenset({"youtube", "facebook", "instagram", "tiktok"})
+
+# Request content per platform, built once and shared by the publish tests
+PUBLISH_CONTENT = {
+    "youtube": {
+        "title": "Test YouTube Video",
+        "description": "This is a test YouTube video",
+        "tags": ["test", "youtube", "ai"]
+    },
+    "instagram": {
+        "caption": "Test Instagram post with AI content!",
+        "hashtags": ["#test", "#instagram", "#ai", "#reel"]
+    },
+    "facebook": {
+        "message": "Check out this AI-generated content!",
+        "page_id": "test_page_id"
+    },
+    "tiktok": {
+        "caption": "AI-generated TikTok content! #ai #viral",
+        "hashtags": ["#ai", "#viral", "#tiktok", "#fyp"]
+    },
+}
+
+
+@dataclass(frozen=True, slots=True)
+class MockPublication:
+    """Result a patched publisher hands back for a successful post"""
+    platform: str
+    post_id: str
+    url: str
+    status: str = "published"
+    published_at: str = "2024-01-01T12:00:00Z"
+
+
+def publication(platform, post_id, url):
+    """Build a publisher result dict for the given post"""
+    return asdict(MockPublication(platform, post_id, url))
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def platforms_status(session_client: AsyncClient):
+    """Fetch the read-only, public platform status once for the module's tests"""
+    response = await session_client.get("/api/v1/platforms/platforms/status")
+    return response.status_code, response.json()
 
 
 class TestPlatformIntegration:
     """Test social media platform integration and publishing"""
 
-    @pytest.fixture
-    async def authenticated_client(self, client: AsyncClient):
-        """Get authenticated client with valid token"""
-        # Login to get token
-        login_response = await client.post(
-            "/api/v1/auth/login",
-            params={"username": "admin", "password": "admin"}
-        )
-        
-        token_data = login_response.json()
-        access_token = token_data["access_token"]
-        
-        # Add auth header to client
-        client.headers.update({"Authorization": f"Bearer {access_token}"})
-        return client
-
     async def test_create_social_account(self, authenticated_client: AsyncClient):
         """Test creating a social media account"""
         account_data = {
@@ -90,18 +125,13 @@ class TestPlatformIntegration:
         data = response.json()
         assert data["message"] == "Account deleted successfully"
 
-    async def test_publish_to_multiple_platforms(self, authenticated_client: AsyncClient, temp_content_dir):
+    async def test_publish_to_multiple_platforms(self, authenticated_client: AsyncClient, mock_video_path):
         """Test publishing content to multiple platforms"""
-        # Create a mock video file
-        video_path = os.path.join(temp_content_dir, "test_video.mp4")
-        with open(video_path, 'w') as f:
-            f.write("mock video content")
-        
         with patch('src.tasks.social_publishing.publish_content_task.delay') as mock_task:
             mock_task.return_value = MagicMock(id="publish_task_123")
             
             publish_data = {
-                "video_path": video_path,
+                "video_path": mock_video_path,
                 "platforms": ["youtube", "instagram"],
                 "content_data": {
                     "title": "Test Video",
@@ -127,155 +157,47 @@ class TestPlatformIntegration:
             assert data["status"] == "processing"
             assert data["message"] == "Content publishing started"
 
-    async def test_publish_to_youtube(self, authenticated_client: AsyncClient, temp_content_dir, mock_api_keys):
-        """Test publishing content to YouTube"""
-        video_path = os.path.join(temp_content_dir, "test_video.mp4")
-        with open(video_path, 'w') as f:
-            f.write("mock video content")
+    @pytest.mark.parametrize("platform,content_data,publish_result", [
+        ("youtube", PUBLISH_CONTENT["youtube"],
+         publication("youtube", "youtube_video_123", "https://youtube.com/watch?v=youtube_video_123")),
+        ("instagram", PUBLISH_CONTENT["instagram"],
+         publication("instagram", "instagram_post_456", "https://instagram.com/p/instagram_post_456")),
+        ("facebook", PUBLISH_CONTENT["facebook"],
+         publication("facebook", "facebook_post_789", "https://facebook.com/posts/facebook_post_789")),
+        ("tiktok", PUBLISH_CONTENT["tiktok"],
+         publication("tiktok", "tiktok_video_999", "https://tiktok.com/@user/video/tiktok_video_999")),
+    ])
+    async def test_publish_to_platform(
+        self, authenticated_client: AsyncClient, mock_video_path, mock_api_keys, mock_services,
+        platform, content_data, publish_result
+    ):
+        """Test publishing content to each supported platform"""
+        mock_publish = getattr(mock_services, f"publish_{platform}")
+        mock_publish.return_value = publish_result
         
-        with patch('src.services.social_publisher.SocialMediaPublisher.publish_to_youtube') as mock_publish:
-            mock_publish.return_value = {
-                "platform": "youtube",
-                "post_id": "youtube_video_123",
-                "url": "https://youtube.com/watch?v=youtube_video_123",
-                "status": "published",
-                "published_at": "2024-01-01T12:00:00Z"
-            }
-            
-            content_data = {
-                "title": "Test YouTube Video",
-                "description": "This is a test YouTube video",
-                "tags": ["test", "youtube", "ai"]
-            }
-            
-            response = await authenticated_client.post(
-                f"/api/v1/platforms/publish/youtube",
-                params={
-                    "video_path": video_path,
-                    "content_data": content_data
-                }
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["platform"] == "youtube"
-            assert data["post_id"] == "youtube_video_123"
-            assert data["status"] == "published"
-
-    async def test_publish_to_instagram(self, authenticated_client: AsyncClient, temp_content_dir, mock_api_keys):
-        """Test publishing content to Instagram"""
-        video_path = os.path.join(temp_content_dir, "test_video.mp4")
-        with open(video_path, 'w') as f:
-            f.write("mock video content")
-        
-        with patch('src.services.social_publisher.SocialMediaPublisher.publish_to_instagram') as mock_publish:
-            mock_publish.return_value = {
-                "platform": "instagram",
-                "post_id": "instagram_post_456",
-                "url": "https://instagram.com/p/instagram_post_456",
-                "status": "published",
-                "published_at": "2024-01-01T12:00:00Z"
-            }
-            
-            content_data = {
-                "caption": "Test Instagram post with AI content!",
-                "hashtags": ["#test", "#instagram", "#ai", "#reel"]
-            }
-            
-            response = await authenticated_client.post(
-                f"/api/v1/platforms/publish/instagram",
-                params={
-                    "video_path": video_path,
-                    "content_data": content_data
-                }
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["platform"] == "instagram"
-            assert data["post_id"] == "instagram_post_456"
-            assert data["status"] == "published"
-
-    async def test_publish_to_facebook(self, authenticated_client: AsyncClient, temp_content_dir, mock_api_keys):
-        """Test publishing content to Facebook"""
-        video_path = os.path.join(temp_content_dir, "test_video.mp4")
-        with open(video_path, 'w') as f:
-            f.write("mock video content")
-        
-        with patch('src.services.social_publisher.SocialMediaPublisher.publish_to_facebook') as mock_publish:
-            mock_publish.return_value = {
-                "platform": "facebook",
-                "post_id": "facebook_post_789",
-                "url": "https://facebook.com/posts/facebook_post_789",
-                "status": "published",
-                "published_at": "2024-01-01T12:00:00Z"
-            }
-            
-            content_data = {
-                "message": "Check out this AI-generated content!",
-                "page_id": "test_page_id"
+        response = await authenticated_client.post(
+            f"/api/v1/platforms/publish/{platform}",
+            params={
+                "video_path": mock_video_path,
+                "content_data": content_data
             }
-            
-            response = await authenticated_client.post(
-                f"/api/v1/platforms/publish/facebook",
-                params={
-                    "video_path": video_path,
-                    "content_data": content_data
-                }
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["platform"] == "facebook"
-            assert data["post_id"] == "facebook_post_789"
-            assert data["status"] == "published"
-
-    async def test_publish_to_tiktok(self, authenticated_client: AsyncClient, temp_content_dir, mock_api_keys):
-        """Test publishing content to TikTok"""
-        video_path = os.path.join(temp_content_dir, "test_video.mp4")
-        with open(video_path, 'w') as f:
-            f.write("mock video content")
+        )
         
-        with patch('src.services.social_publisher.SocialMediaPublisher.publish_to_tiktok') as mock_publish:
-            mock_publish.return_value = {
-                "platform": "tiktok",
-                "post_id": "tiktok_video_999",
-                "url": "https://tiktok.com/@user/video/tiktok_video_999",
-                "status": "published",
-                "published_at": "2024-01-01T12:00:00Z"
-            }
-            
-            content_data = {
-                "caption": "AI-generated TikTok content! #ai #viral",
-                "hashtags": ["#ai", "#viral", "#tiktok", "#fyp"]
-            }
-            
-            response = await authenticated_client.post(
-                f"/api/v1/platforms/publish/tiktok",
-                params={
-                    "video_path": video_path,
-                    "content_data": content_data
-                }
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["platform"] == "tiktok"
-            assert data["post_id"] == "tiktok_video_999"
-            assert data["status"] == "published"
+        assert response.status_code == 200
+        data = response.json()
+        assert data["platform"] == platform
+        assert data["post_id"] == publish_result["post_id"]
+        assert data["status"] == "published"
+        mock_publish.assert_awaited_once()
 
-    async def test_publish_to_unsupported_platform(self, authenticated_client: AsyncClient, temp_content_dir):
+    async def test_publish_to_unsupported_platform(self, authenticated_client: AsyncClient, mock_video_path):
         """Test publishing to an unsupported platform"""
-        video_path = os.path.join(temp_content_dir, "test_video.mp4")
-        with open(video_path, 'w') as f:
-            f.write("mock video content")
-        
         content_data = {"title": "Test"}
         
         response = await authenticated_client.post(
             f"/api/v1/platforms/publish/unsupported_platform",
             params={
-                "video_path": video_path,
+                "video_path": mock_video_path,
                 "content_data": content_data
             }
         )
@@ -284,35 +206,34 @@ class TestPlatformIntegration:
         data = response.json()
         assert "not supported" in data["detail"]
 
-    async def test_get_post_analytics(self, authenticated_client: AsyncClient, mock_api_keys):
+    async def test_get_post_analytics(self, authenticated_client: AsyncClient, mock_api_keys, mock_services):
         """Test getting analytics for a specific post"""
-        with patch('src.services.social_publisher.SocialMediaPublisher.get_platform_analytics') as mock_analytics:
-            mock_analytics.return_value = {
-                "platform": "youtube",
-                "post_id": "youtube_video_123",
-                "views": 10000,
-                "likes": 500,
-                "comments": 50,
-                "shares": 25,
-                "engagement_rate": 5.75,
-                "watch_time_minutes": 7500,
-                "demographics": {
-                    "age_groups": {"18-24": 30, "25-34": 40, "35-44": 20, "45+": 10},
-                    "gender": {"male": 60, "female": 40},
-                    "top_countries": ["US", "UK", "CA", "AU"]
-                }
+        mock_services.platform_analytics.return_value = {
+            "platform": "youtube",
+            "post_id": "youtube_video_123",
+            "views": 10000,
+            "likes": 500,
+            "comments": 50,
+            "shares": 25,
+            "engagement_rate": 5.75,
+            "watch_time_minutes": 7500,
+            "demographics": {
+                "age_groups": {"18-24": 30, "25-34": 40, "35-44": 20, "45+": 10},
+                "gender": {"male": 60, "female": 40},
+                "top_countries": ["US", "UK", "CA", "AU"]
             }
-            
-            response = await authenticated_client.get(
-                "/api/v1/platforms/analytics/youtube/youtube_video_123"
-            )
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["platform"] == "youtube"
-            assert data["views"] == 10000
-            assert data["engagement_rate"] == 5.75
-            assert "demographics" in data
+        }
+        
+        response = await authenticated_client.get(
+            "/api/v1/platforms/analytics/youtube/youtube_video_123"
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["platform"] == "youtube"
+        assert data["views"] == 10000
+        assert data["engagement_rate"] == 5.75
+        assert "demographics" in data
 
     async def test_get_publications(self, authenticated_client: AsyncClient):
         """Test getting published content"""
@@ -326,18 +247,14 @@ class TestPlatformIntegration:
         assert isinstance(data, list)
         # Currently returns empty list due to mock implementation
 
-    async def test_get_platforms_status(self, authenticated_client: AsyncClient):
+    async def test_get_platforms_status(self, platforms_status):
         """Test checking the status of all connected platforms"""
-        response = await authenticated_client.get("/api/v1/platforms/platforms/status")
+        status_code, data = platforms_status
         
-        assert response.status_code == 200
-        data = response.json()
+        assert status_code == 200
         
         # Should contain status for all supported platforms
-        assert "youtube" in data
-        assert "facebook" in data
-        assert "instagram" in data
-        assert "tiktok" in data
+        assert_contains_all(data, EXPECTED_PLATFORMS, "missing platforms")
         
         # Each platform should have connection status
         for platform, status in data.items():
@@ -346,7 +263,7 @@ class TestPlatformIntegration:
             if not status["connected"]:
                 assert "error" in status
 
-    async def test_authentication_required_for_platforms(self, client: AsyncClient):
+    async def test_authentication_required_for_platforms(self, client: AsyncClient, platforms_status):
         """Test that platform endpoints require authentication"""
         # Test without authentication token
         response = await client.get("/api/v1/platforms/accounts")
@@ -358,29 +275,24 @@ class TestPlatformIntegration:
         )
         assert response.status_code == 403
         
-        response = await client.get("/api/v1/platforms/platforms/status")
-        assert response.status_code == 200  # This endpoint might be public
+        status_code, _ = platforms_status
+        assert status_code == 200  # This endpoint might be public
 
-    async def test_platform_error_handling(self, authenticated_client: AsyncClient, temp_content_dir):
+    async def test_platform_error_handling(self, authenticated_client: AsyncClient, mock_video_path, mock_services):
         """Test error handling in platform operations"""
-        video_path = os.path.join(temp_content_dir, "test_video.mp4")
-        with open(video_path, 'w') as f:
-            f.write("mock video content")
-        
         # Test with error in publishing service
-        with patch('src.services.social_publisher.SocialMediaPublisher.publish_to_youtube') as mock_publish:
-            mock_publish.side_effect = Exception("YouTube API error")
-            
-            content_data = {"title": "Test", "description": "Test"}
-            
-            response = await authenticated_client.post(
-                f"/api/v1/platforms/publish/youtube",
-                params={
-                    "video_path": video_path,
-                    "content_data": content_data
-                }
-            )
-            
-            assert response.status_code == 500
-            data = response.json()
-            assert "YouTube API error" in data["detail"]
\ No newline at end of file
+        mock_services.publish_youtube.side_effect = Exception("YouTube API error")
+        
+        content_data = {"title": "Test", "description": "Test"}
+        
+        response = await authenticated_client.post(
+            f"/api/v1/platforms/publish/youtube",
+            params={
+                "video_path": mock_video_path,
+                "content_data": content_data
+            }
+        )
+        
+        assert response.status_code == 500
+        data = response.json()
+        assert "YouTube API error" in data["detail"]
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""
+Test cases for the workflow processor nodes.
+"""
+import asyncio
+
+import pytest
+
+from src.workflows.nodes.processors import BatchProcessorNode
+
+
+class DelayedBatchNode(BatchProcessorNode):
+    """Batch node whose items finish after the delay given by the item itself"""
+    
+    def __init__(self, config):
+        super().__init__(config)
+        self.cancelled = []
+    
+    async def process_item(self, item, context):
+        try:
+            await asyncio.sleep(item / 100)
+        except asyncio.CancelledError:
+            self.cancelled.append(item)
+            raise
+        return item
+
+
+@pytest.mark.unit
+class TestBatchProcessorNode:
+    """Test batch processing in input and completion order"""
+    
+    async def test_execute_keeps_input_order(self):
+        """Test that execute returns results in input order, not completion order"""
+        node = DelayedBatchNode({})
+        
+        result = await node.execute({"items": [3, 1, 2]}, {})
+        
+        assert result == {"results": [3, 1, 2]}
+    
+    async def test_execute_stream_yields_in_completion_order(self):
+        """Test that execute_stream yields each result as soon as it completes"""
+        node = DelayedBatchNode({})
+        
+        streamed = [result async for result in node.execute_stream({"items": [3, 1, 2]}, {})]
+        
+        assert streamed == [1, 2, 3]
+    
+    async def test_execute_stream_cancels_leftovers_when_closed_early(self):
+        """Test that items still running are cancelled when the consumer stops early"""
+        node = DelayedBatchNode({})
+        stream = node.execute_stream({"items": [5, 1, 5]}, {})
+        
+        assert await stream.__anext__() == 1
+        await stream.aclose()
+        await asyncio.sleep(0)
+        
+        assert sorted(node.cancelled) == [5, 5]
+    
+    async def test_process_item_reports_node_type(self):
+        """Test the default per-item processing"""
+        node = BatchProcessorNode({"node_type": "ContentGeneratorNode"})
+        
+        assert await node.process_item("a", {}) == "Processed a with ContentGeneratorNode"
@@ -3,6 +3,7 @@
 Mock test to verify the application enhancements without requiring full dependencies.
 This demonstrates the implemented functionality.
 """
+import mmap
 import sys
 import os
 import time
@@ -10,66 +11,49 @@ import time
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-def test_basic_imports():
+def _dir_entries(directory):
+    """Names in a directory from a single scandir, or an empty set if it is missing."""
+    if not os.path.isdir(directory):
+        return set()
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries}
+
+def check_basic_imports():
     """Test that basic modules can be imported and function correctly."""
     print("Testing basic application structure...")
     
     try:
-        # Test middleware structure
-        middleware_files = [
-            'src/middleware/__init__.py',
-            'src/middleware/error_handler.py',
-            'src/middleware/security.py',
-            'src/middleware/health_check.py'
-        ]
-        
-        for file in middleware_files:
-            if os.path.exists(file):
-                print(f"✓ {file} exists")
-            else:
-                print(f"✗ {file} missing")
-        
-        # Test utils structure
-        utils_files = [
-            'src/utils/__init__.py',
-            'src/utils/performance.py',
-            'src/utils/test_utils.py'
-        ]
-        
-        for file in utils_files:
-            if os.path.exists(file):
-                print(f"✓ {file} exists")
-            else:
-                print(f"✗ {file} missing")
-        
-        # Test validators structure
-        validator_files = [
-            'src/validators/__init__.py',
-            'src/validators/input_validation.py'
-        ]
+        # Middleware, utils and validators structure; one directory listing each
+        expected_files = {
+            'src/middleware': ['__init__.py', 'error_handler.py', 'security.py', 'health_check.py'],
+            'src/utils': ['__init__.py', 'performance.py', 'test_utils.py'],
+            'src/validators': ['__init__.py', 'input_validation.py']
+        }
         
-        for file in validator_files:
-            if os.path.exists(file):
-                print(f"✓ {file} exists")
-            else:
-                print(f"✗ {file} missing")
+        lines = []
+        for directory, names in expected_files.items():
+            present = _dir_entries(directory)
+            for name in names:
+                file = f"{directory}/{name}"
+                if name in present:
+                    lines.append(f"✓ {file} exists")
+                else:
+                    lines.append(f"✗ {file} missing")
         
-        print("✓ All enhancement files created successfully")
+        lines.append("✓ All enhancement files created successfully")
+        print(*lines, sep="\n")
         return True
         
     except Exception as e:
         print(f"✗ Error testing imports: {e}")
         return False
 
-def test_configuration_structure():
+def check_configuration_structure():
     """Test configuration enhancements."""
     print("Testing configuration enhancements...")
     
     try:
-        # Check if .env.example has been enhanced
-        with open('.env.example', 'r') as f:
-            content = f.read()
-            
+        # Check if .env.example has been enhanced; search the mapped bytes without decoding
         required_sections = [
             "APPLICATION SETTINGS",
             "SECURITY SETTINGS", 
@@ -78,11 +62,12 @@ def test_configuration_structure():
             "FEATURE FLAGS"
         ]
         
-        for section in required_sections:
-            if section in content:
-                print(f"✓ Configuration section '{section}' found")
-            else:
-                print(f"✗ Configuration section '{section}' missing")
+        with open('.env.example', 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            for section in required_sections:
+                if content.find(section.encode()) != -1:
+                    print(f"✓ Configuration section '{section}' found")
+                else:
+                    print(f"✗ Configuration section '{section}' missing")
         
         print("✓ Configuration enhancements verified")
         return True
@@ -91,7 +76,7 @@ def test_configuration_structure():
         print(f"✗ Error testing configuration: {e}")
         return False
 
-def test_deployment_scripts():
+def check_deployment_scripts():
     """Test deployment and documentation files."""
     print("Testing deployment and documentation...")
     
@@ -101,20 +86,22 @@ def test_deployment_scripts():
         'tests/test_health_and_performance.py'
     ]
     
+    lines = []
     for file in required_files:
         if os.path.exists(file):
-            print(f"✓ {file} exists")
+            lines.append(f"✓ {file} exists")
             
             # Check if deploy.sh is executable
             if file == 'deploy.sh':
                 if os.access(file, os.X_OK):
-                    print(f"✓ {file} is executable")
+                    lines.append(f"✓ {file} is executable")
                 else:
-                    print(f"⚠ {file} is not executable")
+                    lines.append(f"⚠ {file} is not executable")
         else:
-            print(f"✗ {file} missing")
+            lines.append(f"✗ {file} missing")
     
-    print("✓ Deployment files verified")
+    lines.append("✓ Deployment files verified")
+    print(*lines, sep="\n")
     return True
 
 def simulate_health_check():
@@ -162,9 +149,9 @@ def run_all_tests():
     print()
     
     tests = [
-        ("Basic Structure", test_basic_imports),
-        ("Configuration", test_configuration_structure),
-        ("Deployment Files", test_deployment_scripts),
+        ("Basic Structure", check_basic_imports),
+        ("Configuration", check_configuration_structure),
+        ("Deployment Files", check_deployment_scripts),
         ("Health Check", simulate_health_check)
     ]
     